@@ -9,6 +9,7 @@
 from __future__ import annotations
 
 import cmd
+import contextlib
 import fnmatch
 import glob
 import inspect
@@ -70,6 +71,38 @@ class BaseCommands(cmd.Cmd):
     dir_cmds = ("cd", "mkdir", "rmdir", "mount", "lcd")
     # Commands that have no completion
     noglob_cmds = ("eval", "exec", "alias", "unalias", "set")
+    # Commands which run on the host, outside the raw repl (see board_session())
+    local_cmds = (
+        "include",
+        "shell",
+        "alias",
+        "unalias",
+        "set",
+        "help",
+        "lcd",
+        "echo",
+        "edit",  # Don't hold the raw repl while the editor runs
+    )
+    # Commands which may change files on the board (see onecmd())
+    change_cmds = (
+        "fs",
+        "edit",
+        "shell",  # Local files may be mounted on the board
+        "touch",
+        "mv",
+        "cp",
+        "rm",
+        "put",
+        "rsync",
+        "cd",  # Cached relative pathnames are no longer valid
+        "mkdir",
+        "rmdir",
+        "exec",
+        "eval",
+        "run",
+        "mount",
+        "umount",
+    )
 
     def __init__(self, board: Board):
         self.initialised = False
@@ -89,6 +122,7 @@ class BaseCommands(cmd.Cmd):
         self.params: dict[str, Any] = {}  # Params we can use in prompt
         self.names: dict[str, str] = {}  # Map device unique_ids to names
         self.lsspec: dict[str, str] = {}  # Extra colour specs for %ls
+        self.session = contextlib.ExitStack()  # Holds the raw repl for a cmd line
         readline.set_completer_delims(" \t\n>;")
 
         # Cmd.cmdloop() overrides completion settings in ~/.inputrc
@@ -120,6 +154,7 @@ class BaseCommands(cmd.Cmd):
                 except Exception as err:  # pylint: disable=broad-except
                     print(f"Error loading {rcfile} on line {i + 1}: {line.strip()}")
                     print(f"  {type(err).__name__}: {err}")
+            self.session.close()  # Don't hold the raw repl after the last line
             return True
         return False
 
@@ -147,19 +182,8 @@ class BaseCommands(cmd.Cmd):
             r"\1\2",
             re.sub(r"^COM([0-9]+)$", r"c\1", device_name.lower()),  # COM2 -> c2
         )
-        with catcher():
-            self.params["platform"] = self.board.eval_json(
-                'import sys;print("{!r}".format(sys.platform))'
-            )
-        with catcher():
-            self.params["unique_id"] = self.board.eval_json(
-                "from machine import unique_id;"
-                'print("{!r}".format(unique_id().hex(":")))'
-            )
-        with catcher():
-            self.params.update(  # Update the board params from os.uname()
-                self.board.eval_json('print(repr(eval(f"dict{os.uname()!r}")))')
-            )
+        with catcher():  # Fetch platform, unique_id and os.uname() in one call
+            self.params.update(self.board.info())
         self.params["id"] = self.params["unique_id"][-8:]  # Last 3 octets
         # Add the ansi colour names
         self.params.update({c: self.colour.ansi(c) for c in self.colour.colour})
@@ -174,7 +198,8 @@ class BaseCommands(cmd.Cmd):
             )
             return
         self.load_board_params()
-        pwd, alloc, free = self.board.eval_json("_helper.pr()")
+        status = self.board.status(pwd=True, mem=True)  # One call to the board
+        pwd, (alloc, free) = status["pwd"], status["mem"]
 
         free_pc = round(100 * free / (alloc + free), None) if alloc > 0 else 0
         free_delta = max(0, self.params.get("free", free) - free)
@@ -683,24 +708,44 @@ class BaseCommands(cmd.Cmd):
             # Split the command line into a list of args
             args = list(self.split(line))
 
+        self.board_session(args[0] if args else "")  # For any remote globbing
         args = self.process_args(args)  # Expand aliases, macros and globs
         command, *args = args or [""]
+        self.board_session(command)  # Command may have changed (aliases)
         self.lastcmd = ""
         func = getattr(self, "do_" + command, None)
-        if func:
-            ret: bool = func(args)
-        else:
-            ret = self.default(" ".join([command, *args]))
+        try:
+            if func:
+                ret: bool = func(args)
+            else:
+                ret = self.default(" ".join([command, *args]))
+        finally:
+            if command in self.change_cmds:  # Discard stale file listings
+                self.board.clear_cache()
         return ret
 
+    def board_session(self, command: str) -> None:
+        """Enter the raw repl once for a run of board commands on a line (and
+        the prompt update) instead of once for each command. Leave it before
+        any other command (eg. %edit or %shell) and after the last command
+        (see postcmd())."""
+        if command in self.local_cmds or not hasattr(self, f"do_{command}"):
+            self.session.close()
+        elif not self.board.transport.in_raw_repl:
+            self.session.enter_context(self.board.raw_repl())
+
     def postcmd(self, stop: Any, line: str) -> bool:
         self.set_prompt()  # Setup our complicated prompt
+        if not self.cmdqueue:
+            self.session.close()  # Leave the raw repl after the last command
         # Exit if we are in single command mode and no commands in the queue
         return not self.multi_cmd_mode and not self.cmdqueue
 
     def run(self, prefix: bytes = b"%") -> None:
         "Catch exceptions and restart the Cmd.cmdloop()."
         self.initialise()  # Load the helper code onto the board
+        # Files on the board may have been changed from the micropython repl
+        self.board.clear_cache()
         self.shell_mode = prefix == b"!"
         stop = False
         while not stop:
@@ -713,6 +758,7 @@ class BaseCommands(cmd.Cmd):
                 print_exc()
                 # raise
             finally:
+                self.session.close()  # In case a command raised an exception
                 if stop := not self.multi_cmd_mode:
                     print(f"{self.colour.ansi('reset')}", end="")
                     print(self.base_prompt, end="", flush=True)
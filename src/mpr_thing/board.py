@@ -7,14 +7,25 @@ PyBoardExtended interface to a micropython board (from the mpremote tool).
 # For python<3.10: Allow method type annotations to reference enclosing class
 from __future__ import annotations
 
+import functools
 import itertools
 import json
 import os
 import re
+import stat
 import time
+import zlib
 from enum import IntFlag
 from pathlib import Path
-from typing import Any, Callable, Iterable, Optional, Sequence
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 
 from mpremote.transport_serial import SerialTransport
 
@@ -27,13 +38,50 @@ PathLike = str | os.PathLike  # Accepts str or Pathlib for filenames
 RemoteFilename = str | RemotePath
 RemoteFilenames = Iterable[RemoteFilename]
 RemoteDirlist = dict[str, list[RemotePath]]
-
-CODE_COMPRESS_RULES: list[tuple[bytes, bytes, dict[str, int]]] = [
-    (b" *#.*$", b"", {"flags": re.MULTILINE}),  # Delete comments
-    (b"    ", b" ", {}),  # Replace 4 spaces with 1
-    (rb"([,;])  *", rb"\1", {}),  # Remove spaces after , and ;
-    (rb"  *([=+-])  *", rb"\1", {}),  # Remove spaces around =, + and -
-]
+Number = TypeVar("Number", int, float)
+
+# Compress the helper code in one pass: the group which matched selects the
+# replacement text (see _compress_match()). Indents are replaced first with
+# bytes.replace(b"    ", b" ").
+CODE_COMPRESS_RE = re.compile(
+    rb"(?P<comment> *#.*$)"  # Delete comments
+    rb"|(?P<sep>[,;])  *"  # Remove spaces after , and ;
+    rb"|  *(?P<op>[=+-])  *",  # Remove spaces around =, + and -
+    re.MULTILINE,
+)
+
+# The helper code loaded onto the board.
+HELPER_FILE = Path(__file__).parent / "board" / "cmd_helper.py"
+
+# Helper arguments longer than this are sent as a json string for the board to
+# decode, rather than as python code for the board to compile.
+ARGS_INLINE_MAX = 1024
+
+
+def getenv_number(name: str, default: Number, minimum: Number) -> Number:
+    """Return the value of the environment variable "name" as the same type
+    as "default". Use the default if it is not set or not a valid number."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = type(default)(value)
+        if number >= minimum:
+            return number
+    except ValueError:
+        pass
+    print(f"Warning: Invalid {name}={value!r} (using {default}).")
+    return default
+
+
+# Directory listings are cached for this many seconds (0 disables the cache).
+LS_CACHE_TTL = getenv_number("MPR_LS_TTL", 5.0, 0.0)
+# And at most this many entries are kept in each cache (oldest are dropped).
+LS_CACHE_SIZE = 256
+
+# Bytes per exec() when copying files to/from the board (as for mpremote).
+# Also the size of the buffer used to copy files on the board.
+FS_CHUNK_SIZE = getenv_number("MPR_CHUNK_SIZE", 256, 1)
 
 
 class Debug(IntFlag):
@@ -42,12 +90,27 @@ class Debug(IntFlag):
     FILES = 2
 
 
+class Status(IntFlag):  # Flags for the values returned by _helper.status()
+    PWD = 1
+    TIME = 2
+    GC = 4
+    MEM = 8
+
+
 class RemoteFolder:
     def __init__(self, ls: RemoteDirlist) -> None:
-        self.ls = {str(f): f for _, files in ls.items() for f in files}
+        self.ls: dict[str, RemotePath] = {}
+        for files in ls.values():
+            for f in files:
+                self.ls[str(f)] = f
+        self.missing: dict[str, RemotePath] = {}  # Re-use paths not on board
 
     def __getitem__(self, file: str | RemotePath) -> RemotePath:
-        return self.ls.get(str(file)) or RemotePath(str(file))
+        name = str(file)
+        f = self.ls.get(name) or self.missing.get(name)
+        if f is None:
+            f = self.missing[name] = RemotePath(name)
+        return f
 
 
 def slashify(path: Path | RemotePath | str) -> str:
@@ -61,6 +124,38 @@ def deslashify(path: Path | RemotePath | str) -> str:
     return s if s == "/" else s.rstrip("/")
 
 
+def scandir_walk(path: str) -> Iterator[tuple[str, list[os.DirEntry[str]]]]:
+    """Like os.walk() but yields (dirname, [DirEntry, ...]) for each directory.
+    The stat() results are cached in the DirEntry objects. As for os.walk(),
+    symlinks to directories are not followed and unreadable dirs are skipped."""
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    yield path, entries
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from scandir_walk(entry.path)
+
+
+def _compress_match(match: re.Match[bytes]) -> bytes:
+    "Return the replacement text for a match of CODE_COMPRESS_RE."
+    return match["sep"] or match["op"] or b""
+
+
+def compress_code(code: bytes) -> bytes:
+    "Strip indents, comments and spaces from the helper code."
+    code = code.replace(b"    ", b" ")  # Replace 4 spaces with 1
+    return CODE_COMPRESS_RE.sub(_compress_match, code)
+
+
+@functools.lru_cache(maxsize=1)
+def helper_code() -> bytes:
+    "Return the compressed code for the helper to load onto the board."
+    return compress_code(HELPER_FILE.read_bytes())
+
+
 # A collection of helper functions for file listings and filename completion
 # to be uploaded to the micropython board and processed on the local host.
 class Board:
@@ -81,22 +176,37 @@ class Board:
         self.debug: Debug = Debug.NONE
         self.board_has_utime: bool = False  # See PR#9644
         self.helper_loaded = False
+        self.ls_ttl: float = LS_CACHE_TTL
+        self.chunk_size: int = FS_CHUNK_SIZE
+        # Cache of file listings from the board: {code: (timestamp, result)}
+        self._ls_cache: dict[str, tuple[float, Any]] = {}
+        # Cache of file stats from the board: {filename: (timestamp, stat)}
+        self._stat_cache: dict[str, tuple[float, list[int]]] = {}
+        self._cwd: Optional[str] = None  # Cache of current directory on board
         # RemotePath._board = self
 
     def reset(self) -> None:
         self.helper_loaded = False
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """Discard cached file listings. Called after each command which may
+        change files on the board (see BaseCommands.onecmd())."""
+        self._ls_cache.clear()
+        self._stat_cache.clear()
+        self._cwd = None
 
     def load_helper(self) -> None:
         "Load the __helper class and methods onto the micropython board."
         if self.helper_loaded:
             return
-        # The helper code is "board/cmd_helper.py" in the module directory.
-        micropy_file = Path(__file__).parent / "board" / "cmd_helper.py"
-        with open(micropy_file, "rb") as f:
-            code = f.read()
-        for a, b, flags in CODE_COMPRESS_RULES:
-            code = re.sub(a, b, code, **flags)
-        self.exec(code)
+        # Skip the upload if the board still has this helper from a previous
+        # session (the board has not been reset since then).
+        code = helper_code() + f"\n_MagicHelper.BUF_SIZE={self.chunk_size}".encode()
+        helper_id = f"{zlib.crc32(code):08x}"
+        loaded = f"print(int(globals().get('_helper_id')=={helper_id!r}))"
+        if not self.eval_json(loaded):
+            self.exec(code + f"\n_helper_id={helper_id!r}".encode())
         self.check_time_offset()
         self.board_has_utime = bool(
             self.eval_json("print(int('utime' in os.__dict__))")
@@ -113,16 +223,14 @@ class Board:
         "Get the name of the serial port connected to the micropython board."
         return str(self.transport.device_name)
 
-    def write(self, response: bytes | str) -> None:
-        'Call the console writer for output (convert "str" to "bytes").'
+    def write_bytes(self, response: bytes) -> None:
+        "Call the console writer for output."
         if response:
-            if isinstance(response, str):
-                response = bytes(response, "utf-8")
             self.writer(response)
 
     def raw_repl(self, message: Any = None) -> Any:
         "Return a context manager for the micropython raw repl."
-        return raw_repl(self.transport, self.write, message)
+        return raw_repl(self.transport, self.write_bytes, message)
 
     # Execute stuff on the micropython board
     def exec(self, code: bytes | str, silent: bool = True) -> str:
@@ -132,50 +240,103 @@ class Board:
             print(f"Board.exec(): code = {code!r}")
         with self.raw_repl(code):
             writer = self.writer if not silent else None
-            response = self.transport.exec(code, writer).decode().strip()
+            response = self.transport.exec(code, writer).strip().decode()
         if self.debug & Debug.EXEC:
             print(f"Board.exec(): resp = {response}")
         return response
 
     def eval_json(self, code: str) -> Any:
         """Execute code on board and interpret the output as json.
-        Single quotes (') in output will be changed to " before processing."""
+        The code should print its result with json.dumps() on the board."""
         response = self.exec(code)
         # Safer to use json to construct objects rather than eval().
         # Exceptions will be caught at the top level.
-        return json.loads(response.replace("'", '"'))
+        return json.loads(response)
+
+    def eval_json_lines(self, code: str) -> list[Any]:
+        """Execute code on board and interpret each line of output as json.
+        Each line is decoded as soon as it arrives from the board."""
+        results: list[Any] = []
+        errors: list[ValueError] = []
+        line = bytearray()
+
+        def consume(data: bytes) -> None:
+            line.extend(data)
+            if b"\n" in data and not errors:  # Decode the complete lines
+                *lines, rest = line.split(b"\n")
+                line[:] = rest
+                try:
+                    results.extend(json.loads(s) for s in lines if s.strip())
+                except ValueError as err:  # Raise after all output is read
+                    errors.append(err)
 
-    def complete(self, word: str) -> list[str]:
-        "Complete the python name on the board."
-        words = [""] + word.rsplit(".", 1)  # Split module and class names
-        completions: list[str] = self.eval_json(
-            f"_helper.complete({words[-2]!r}, {words[-1]!r})"
-        )
-        return completions
+        if self.debug & Debug.EXEC:
+            print(f"Board.eval_json_lines(): code = {code!r}")
+        with self.raw_repl(code):
+            self.transport.exec(code, consume)
+            if errors:
+                raise errors[0]
+            return results
+        return []  # The raw_repl caught an error from the board
+
+    def _eval_cached(
+        self, code: str, evaluate: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """Execute code on board with eval_json() (or "evaluate") and cache the
+        result for "ls_ttl" seconds. Only use for code which does not change
+        the board."""
+        now = time.monotonic()
+        cached = self._ls_cache.get(code)
+        if cached and now - cached[0] < self.ls_ttl:
+            return cached[1]
+        result = (evaluate or self.eval_json)(code)
+        if self.ls_ttl > 0 and result:  # Don't cache errors (empty results)
+            self._ls_cache[code] = (now, result)
+            self._trim_cache(self._ls_cache)
+        return result
+
+    @staticmethod
+    def _trim_cache(cache: dict[str, Any]) -> None:
+        "Drop the oldest entries if the cache has grown too large."
+        excess = len(cache) - LS_CACHE_SIZE
+        if excess > 0:
+            for key in list(itertools.islice(cache, excess)):
+                del cache[key]
+
+    def _helper_call(self, method: str, *args: Any) -> str:
+        'Return the code to call "_helper.method(*args)" on the board.'
+        code = ",".join(repr(arg) for arg in args)
+        if len(code) > ARGS_INLINE_MAX:
+            # Cheaper for the board to decode one string than to compile a big
+            # list of strings into python objects.
+            code = f"*json.loads({json.dumps(args)!r})"
+        return f"_helper.{method}({code})"
 
     def cat(self, filename: str) -> None:
         'List the contents of the file "filename" on the board.'
-        with self.raw_repl():
-            self.transport.fs_cat(filename)
+        self.exec(
+            f"with open({filename!r}) as f:\n while 1:\n"
+            f"  b=f.read({self.chunk_size})\n  if not b:break\n  print(b,end='')",
+            silent=False,
+        )
 
     def touch(self, filename: str) -> None:
-        with self.raw_repl():
-            self.transport.fs_touch(filename)
+        self.exec(f"open({filename!r},'a').close()")
 
     def cd(self, filename: str) -> None:
         self.exec(f"os.chdir({filename!r})")
 
     def pwd(self) -> str:
-        pwd: str = self.eval_json('print("\\"{}\\"".format(os.getcwd()))')
-        return pwd
+        "Return the current directory on the board (cached until next cd)."
+        if self._cwd is None:
+            self._cwd = str(self.status(pwd=True)["pwd"])
+        return self._cwd
 
     def mkdir(self, filename: str) -> None:
-        with self.raw_repl():
-            self.transport.fs_mkdir(filename)
+        self.exec(f"os.mkdir({filename!r})")
 
     def rmdir(self, filename: str) -> None:
-        with self.raw_repl():
-            self.transport.fs_rmdir(filename)
+        self.exec(f"os.rmdir({filename!r})")
 
     def mount(self, directory: str, opts: str = "") -> None:
         path = os.path.realpath(directory)
@@ -192,39 +353,52 @@ class Board:
         with self.raw_repl():
             self.transport.umount_local()
 
-    def ls_files(self, filenames: RemoteFilenames) -> Iterable[RemotePath]:
+    def ls_files(self, filenames: RemoteFilenames) -> list[RemotePath]:
         "Return a list of files (RemotePath) on board for list of filenames."
         # Board returns: {"f1": [s0, s1, s2], "f2": [s0, s1, s2], ...}
         # Where s0 is mode, s1 is size and s2 is mtime
-        ls = self.eval_json(f"_helper.ls_files({[str(f) for f in filenames]})")
-        return (RemotePath(f).set_stat(m) for f, m in ls.items())
+        # Only fetch stats for the files which are not in the stat cache.
+        now, cache = time.monotonic(), self._stat_cache
+        names = [str(f) for f in filenames if str(f)]
+        stats = {
+            f: cache[f][1]
+            for f in names
+            if f in cache and now - cache[f][0] < self.ls_ttl
+        }
+        fetch = list(dict.fromkeys(f for f in names if f not in stats))
+        if fetch:
+            stats.update(self.eval_json(self._helper_call("ls_files", fetch)))
+            if self.ls_ttl > 0:
+                cache.update((f, (now, stats[f])) for f in fetch)
+                self._trim_cache(cache)
+        return [RemotePath(f).set_stat(stats[f]) for f in names]
 
     def ls(self, filenames: RemoteFilenames, opts: str = "") -> RemoteDirlist:
         """Return a listing of files in directories on the board.
         Takes a list of directory pathnames and a listing options string.
         Returns an iterable over: [(dirname, [Path1, Path2, Path3..]), ...]
         """
-        # From the board: {
-        #  "dir":  {"f1": [mode, size, mtime], "f2": [mode..], ...},
-        #  "dir2": {"f1": [mode, size, mtime], "f2": [mode..], ...}, ...
-        # }
-        opts = f"{'R' in opts},{'l' in opts}"
-        file_list = [deslashify(d) for d in (filenames or ["."])]
-        listing: dict[str, dict[str, list[int]]] = self.eval_json(
-            f"_helper.ls({file_list},{opts})"
+        # From the board, one json line for each directory:
+        #  ["dir",  {"f1": [mode, size, mtime], "f2": [mode..], ...}]
+        #  ["dir2", {"f1": [mode, size, mtime], "f2": [mode..], ...}] ...
+        # Drop duplicate names: the listing is a dict keyed by dirname anyway.
+        file_list = list(dict.fromkeys(deslashify(d) for d in (filenames or ["."])))
+        listing: list[tuple[str, dict[str, list[int]]]] = self._eval_cached(
+            self._helper_call("ls", file_list, "R" in opts, "l" in opts),
+            self.eval_json_lines,
         )
         return {  # Convert to dicts of list of RemotePath objects
             dirname: [RemotePath(dirname, f).set_stat(m) for f, m in filelist.items()]
-            for dirname, filelist in listing.items()
+            for dirname, filelist in listing
         }
 
     def ls_dir(self, directory: RemoteFilename) -> Iterable[str]:
         """Return the list of files in a directory on the board."""
-        return self.eval_json(f"_helper.ls_dir({str(directory)!r})")
+        return self._eval_cached(self._helper_call("ls_dir", str(directory)))
 
     def remotefile(self, filename: RemoteFilename) -> RemotePath:
         "Return a RemotePath object for the filename on the board."
-        file_stat = self.eval_json(f"_helper.stat({str(filename)!r})")
+        file_stat = self.eval_json(self._helper_call("stat", str(filename)))
         return RemotePath(str(filename)).set_stat(file_stat)
 
     def remotefolder(self, folder: RemoteFilename) -> RemoteFolder:
@@ -236,15 +410,21 @@ class Board:
     ) -> tuple[list[RemotePath], Optional[RemotePath]]:
         filelist = list(self.ls_files([*filenames, dest] if dest else filenames))
         dest_f = filelist.pop() if dest else None
-        missing = [str(f) for f in filelist if not f.exists()]
-        dirs = [str(d) + "/" for d in filelist if d.is_dir()]
+        missing: list[str] = []
+        dirs: list[str] = []
+        for f in filelist:  # Sort out missing files and dirs in one pass
+            if not f.exists():
+                missing.append(str(f))
+            elif f.is_dir():
+                dirs.append(str(f) + "/")
         # Check for invalid requests
         if missing:
             print(f"%{cmd}: Error: Missing files: {missing}.")
             return ([], None)
         if dest_f:
+            dest_parents = set(dest_f.parents)  # Build the set only once
             for f in filelist:
-                if f.is_dir() and f in dest_f.parents:
+                if f.is_dir() and f in dest_parents:
                     print(f"%{cmd}: Error: {dest!r} is subfolder of {f!r}")
                     return ([], None)
                 if str(f) == dest:
@@ -257,57 +437,64 @@ class Board:
         return (filelist, dest_f)
 
     def rm(self, filenames: RemoteFilenames, opts: str) -> None:
-        files, _ = self.check_files("rm", filenames, "", opts)
-        self.exec(f"_helper.rm({[str(f) for f in files]},{'v' in opts})", silent=False)
+        with self.raw_repl():  # Enter the raw repl once for all commands
+            files, _ = self.check_files("rm", filenames, "", opts)
+            self.exec(
+                self._helper_call("rm", [str(f) for f in files], "v" in opts),
+                silent=False,
+            )
 
     def mv(self, filenames: RemoteFilenames, dest: str, opts: str) -> None:
-        filelist, dest_f = self.check_files("mv", filenames, dest, opts)
-        if not filelist or not dest_f:
-            return
-        if len(filelist) == 1 and not dest_f.is_dir():
-            # First - check for special cases...
-            f = filelist[0]
-            if not dest_f.exists() or f.is_file():
-                if "v" in opts:
-                    print(f"{str(f)} -> {str(dest)}")
-                self.exec(f"os.rename({str(f)!r},{dest!r})")
-            else:
-                print(f"%mv: Error: Destination must be directory: {dest!r}")
-            return
-        # Move files to dest which is a directory
-        for f in filelist:
-            f2 = dest_f / f.name
-            if "v" in opts:
-                print(f"{str(f)} -> {str(f2)}")
-            self.exec(f"os.rename({str(f)!r},{str(f2)!r})")
+        with self.raw_repl():  # Enter the raw repl once for all commands
+            filelist, dest_f = self.check_files("mv", filenames, dest, opts)
+            if not filelist or not dest_f:
+                return
+            if len(filelist) == 1 and not dest_f.is_dir():
+                # First - check for special cases...
+                f = filelist[0]
+                if not dest_f.exists() or f.is_file():
+                    if "v" in opts:
+                        print(f"{str(f)} -> {str(dest)}")
+                    self.exec(f"os.rename({str(f)!r},{dest!r})")
+                else:
+                    print(f"%mv: Error: Destination must be directory: {dest!r}")
+                return
+            # Move files to dest which is a directory (in one call)
+            moves = [(str(f), str(dest_f / f.name)) for f in filelist]
+            self.exec(self._helper_call("mv", moves, "v" in opts), silent=False)
 
     def cp(self, filenames: RemoteFilenames, dest: str, opts: str) -> None:
         "Copy files and directories on the micropython board."
-        filelist, dest_f = self.check_files("cp", filenames, dest, opts)
-        if not filelist or not dest_f:
-            return
-        dest = str(dest_f)
-        files = [str(f) for f in filelist if f.is_file()]
-        dirs = [str(d) + "/" for d in filelist if d.is_dir()]
-        opts = f"{'v' in opts}"
-        if len(filelist) == 1:
-            # First - check for some special cases...
-            if files and (dest_f.is_file() or not dest_f.exists()):
-                # cp file1 file2 ???: why not use fs_cp()?
-                self.exec(
-                    f"_helper.cp_file({files[0]!r},{dest!r},{opts})", silent=False
-                )
+        with self.raw_repl():  # Enter the raw repl once for all commands
+            filelist, dest_f = self.check_files("cp", filenames, dest, opts)
+            if not filelist or not dest_f:
                 return
-            elif dirs and not dest_f.exists():
-                # cp dir1 dir2 (where dir2 does not exist)
-                self.exec(
-                    f'_helper.cp_dir({dirs[0]!r},{dest + "/"!r},{opts})', silent=False
-                )
+            dest = str(dest_f)
+            files = [str(f) for f in filelist if f.is_file()]
+            dirs = [str(d) + "/" for d in filelist if d.is_dir()]
+            verbose = "v" in opts
+            if len(filelist) == 1:
+                # First - check for some special cases...
+                if files and (dest_f.is_file() or not dest_f.exists()):
+                    # cp file1 file2 ???: why not use fs_cp()?
+                    self.exec(
+                        self._helper_call("cp_file", files[0], dest, verbose),
+                        silent=False,
+                    )
+                    return
+                elif dirs and not dest_f.exists():
+                    # cp dir1 dir2 (where dir2 does not exist)
+                    self.exec(
+                        self._helper_call("cp_dir", dirs[0], dest + "/", verbose),
+                        silent=False,
+                    )
+                    return
+            if not dest_f.is_dir():
+                print(f"%cp: Destination must be a directory: {dest}")
                 return
-        if not dest_f.is_dir():
-            print(f"%cp: Destination must be a directory: {dest}")
-            return
-        self.exec(f'_helper.cp({files},{dirs},{dest + "/"!r},{opts})', silent=False)
+            self.exec(
+                self._helper_call("cp", files, dirs, dest + "/", verbose), silent=False
+            )
 
     def get_file(
         self,
@@ -321,7 +508,9 @@ class Board:
             print(str(dest))
         if not dry_run:
             with self.raw_repl(("get_file", filename, dest)):
-                self.transport.fs_get(str(filename), str(dest))
+                self.transport.fs_get(
+                    str(filename), str(dest), chunk_size=self.chunk_size
+                )
 
     def get_dir(
         self, directory: PathLike, dest: PathLike, verbose: bool, dry_run: bool
@@ -376,56 +565,77 @@ class Board:
                 elif not file.exists():
                     print(f"{str(file)}: No such file.")
 
-    def skip_file(self, source: Path, dest: RemotePath) -> bool:
+    def skip_file(self, source: os.stat_result, dest: RemotePath) -> bool:
         "If local is not newer than remote, return True."
-        s = source.stat()
-        size, mtime = s[6], round(s[8])
-        return (source.is_dir() and dest.is_dir()) or (
-            source.is_file()
+        if stat.S_ISDIR(source.st_mode):
+            return dest.is_dir()
+        return (
+            stat.S_ISREG(source.st_mode)
             and dest.is_file()
-            and dest.mtime >= mtime
-            and dest.size == size
+            and dest.mtime >= source[8]  # Integer mtime
+            and dest.size == source.st_size
         )
 
-    def put_file(self, source: Path, dest: RemotePath, opts: str = "") -> None:
-        "Copy a local file `source` to `dest` on the board."
-        if not source.exists():
-            raise FileNotFoundError(f"Local file does not exist: '{source}'")
-        if source.is_dir() and dest.is_file():
+    def put_file(
+        self,
+        source: Path,
+        dest: RemotePath,
+        opts: str = "",
+        st: Optional[os.stat_result] = None,
+    ) -> None:
+        """Copy a local file `source` to `dest` on the board.
+        `st` is the result of `source.stat()` if the caller already has it."""
+        try:
+            st = st or source.stat()  # Just one stat() call for the local file
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Local file does not exist: '{source}'") from None
+        is_dir, is_file = stat.S_ISDIR(st.st_mode), stat.S_ISREG(st.st_mode)
+        if is_dir and dest.is_file():
             raise OSError(f"Can not copy local dir to remote file {str(dest)}")
-        if source.is_file() and dest.is_dir():
+        if is_file and dest.is_dir():
             raise OSError(f"Can not copy local file to remote dir {str(dest)}")
         if self.debug & Debug.FILES:
             print(f"local: {source!r}\nremote: {dest!r}")
-        if "s" in opts and self.skip_file(source, dest):
+        if "s" in opts and self.skip_file(st, dest):
             return  # Skip if same size and same time or newer on board
         if "v" in opts:
             print(slashify(dest))
         if "n" in opts:
             return
-        if source.is_file():
-            self.transport.fs_put(str(source), str(dest))
-        elif source.is_dir() and not dest.exists():
+        if is_file:
+            self.transport.fs_put(str(source), str(dest), chunk_size=self.chunk_size)
+        elif is_dir and not dest.exists():
             self.mkdir(str(dest))
         if "t" in opts and self.board_has_utime:
             # Requires micropython PR#9644
-            mtime = round(source.stat()[8])
+            mtime = st[8]
             self.exec(f"os.utime({str(dest)!r},(0,{mtime - RemotePath.epoch_offset}))")
 
     def put_dir(self, source: Path, dest: RemotePath, opts: str = "") -> None:
         "Recursively copy a directory to the micropython board."
         source = source.resolve()
         base = source.parent
-        # Destination subdir is dest + basename of file
-        destdir = dest / source.name
-        for dirname, _, files in os.walk(source):
+        walk = list(scandir_walk(str(source)))
+        # Dest subdirs are dest + relative path from dir to base
+        destdirs = self.ls_files(  # Stat all the dest subdirs in one call
+            str(dest / Path(dirname).relative_to(base)) for dirname, _ in walk
+        )
+        new_dirs = [d for d in destdirs if not d.exists()]
+        if new_dirs and "n" not in opts:  # Make all the new subdirs in one call
+            made = self.eval_json(
+                self._helper_call("mkdirs", [str(d) for d in new_dirs])
+            )
+            for d in new_dirs[:made]:
+                d.set_stat([stat.S_IFDIR])
+            if made < len(new_dirs):
+                raise OSError(f"Can not make remote dir {str(new_dirs[made])}")
+        for (dirname, entries), destdir in zip(walk, destdirs):
             subdir = Path(dirname)
-            # Dest subdir is dest + relative path from dir to base
-            destdir = dest / subdir.relative_to(base)
-            d = list(self.ls_files([str(destdir)]))[0]
-            self.put_file(subdir, d, opts)
-            for f in files:
-                self.put_file(subdir / f, destdir / f, opts)
+            self.put_file(subdir, destdir, opts)
+            for entry in entries:
+                if not entry.is_dir():  # DirEntry.stat() result is cached
+                    f = entry.name
+                    self.put_file(subdir / f, destdir / f, opts, entry.stat())
 
     def put(
         self, filenames: Iterable[str], destname: RemoteFilename, opts: str = ""
@@ -463,21 +673,47 @@ class Board:
                 self.put_file(local, remote, opts)
 
     def df(self, dirs: RemoteFilenames) -> Sequence[tuple[str, int, int, int]]:
-        ret: list[tuple[str, int, int, int]] = []
-        for d in dirs or ["/"]:
-            _, bsz, tot, free, *_ = self.eval_json(
-                f'print(list(os.statvfs("{str(d)}")))'
-            )
-            ret.append((str(d), tot * bsz, (tot - free) * bsz, free * bsz))
-        return ret
+        dirlist = [str(d) for d in dirs or ["/"]]
+        # One call for all dirs: [[frsize, blocks, bfree], ...]
+        stats = self.eval_json(self._helper_call("df", dirlist))
+        return [
+            (d, tot * bsz, (tot - free) * bsz, free * bsz)
+            for d, (bsz, tot, free) in zip(dirlist, stats)
+        ]
+
+    def status(
+        self,
+        *,
+        pwd: bool = False,
+        time_: bool = False,
+        gc: bool = False,
+        mem: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch any of the current directory, the local time, the free memory
+        before and after garbage collection and the allocated and free memory
+        from the board in one call.
+        Returns a dict with keys: "pwd", "time", "gc" and "mem" (as requested)."""
+        flags = (
+            (Status.PWD if pwd else 0)
+            | (Status.TIME if time_ else 0)
+            | (Status.GC if gc else 0)
+            | (Status.MEM if mem else 0)
+        )
+        code = self._helper_call("status", int(flags))
+        status: dict[str, Any] = self.eval_json(code)
+        return status
+
+    def info(self) -> dict[str, str]:
+        """Fetch the static details of the board in one call.
+        Returns a dict with keys: "platform", "unique_id" and the fields of
+        os.uname() (sysname, nodename, release, version and machine)."""
+        info: dict[str, str] = self.eval_json(self._helper_call("info"))
+        return info
 
     def gc(self) -> tuple[int, int]:
-        before, after = self.eval_json(
-            "import gc;_b=gc.mem_free();gc.collect();print([_b,gc.mem_free()])"
-        )
+        before, after = self.status(gc=True)["gc"]
         return (int(before), int(after))
 
     def get_time(self) -> time.struct_time:
-        time_cmd = "import time;print(list(time.localtime()))"
-        time_list = list(self.eval_json(time_cmd)) + [-1]  # is_dst = unknown
+        time_list = list(self.status(time_=True)["time"]) + [-1]  # is_dst unknown
         return time.struct_time(time_list)
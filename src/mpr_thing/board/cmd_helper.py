@@ -4,7 +4,9 @@
 # pylint: skip-file  # pylint ignores the additional micropython typings
 
 import gc
+import json
 import os
+import time
 
 from micropython import const
 
@@ -23,75 +25,123 @@ class _MagicHelper:
         except OSError: return []
 
     def stat(self, f):
-        print(self._stat(f))
+        print(json.dumps(self._stat(f)))
 
     def ls_files(self, files):
         # {"f1": [s0, s1, s2], "f2": [s0, s1, s2], ...
-        print({f: self._stat(f) for f in files if f})
+        print(json.dumps({f: self._stat(f) for f in files if f}))
 
     def ls_dir(self, d):
-        print([f[0] + ("/" if (f[1] & IS_DIR) else "") for f in os.ilistdir(d)])  # type: ignore
+        ls = sorted(os.ilistdir(d))  # type: ignore
+        print(json.dumps([f[0] + ("/" if (f[1] & IS_DIR) else "") for f in ls]))
 
     def ls(self, files, R, long):
-        # {"": {"files[0]": [s0, s1, s2], "files[1]": [s0, s1, s2], ...}
-        #  "dir":  {"f1": [s0, s1, s2], "f2": [s0..], ..},
-        #  "dir2": {"f1": [s0, s1, s2], "f2": [s0..], ..}, ...}
+        # Print one json line for each directory (and one for the files):
+        # ["", {"files[0]": [s0, s1, s2], "files[1]": [s0, s1, s2], ...}]
+        # ["dir",  {"f1": [s0, s1, s2], "f2": [s0..], ..}]
+        # ["dir2", {"f1": [s0, s1, s2], "f2": [s0..], ..}] ...
         ls = {f: self._stat(f) for f in files if f}
-        print('{"":', ls, end="")
-        # If recursive, subdirs will be added to end of "dirs" as we go.
-        sep1 = ","
+        print(json.dumps(["", ls]))
+        # Depth first: dirs are pushed in reverse order so they pop in order.
+        # If recursive, subdirs are pushed onto "files" as we go.
+        files = files[::-1]
         while files:
             d = files.pop()
-            m = ls.get(d, self._stat(d))
+            m = ls.get(d) or self._stat(d)
             if not m or not m[0] & IS_DIR: continue # skip ordinary files
-            print(f'{sep1}"{d}":{{ ', end="")
-            sep2 = ""
-            for f, m, *_ in os.ilistdir(d):  # type: ignore
-                p = f"{d}/{f}"
-                if R and m & IS_DIR: files.append(p)  # Add dir to list for processing
-                s = self._stat(p) if long else [m]
-                print(f'{sep2}"{f}":{s}', end="")
-                sep2 = ","
-            print("}")
-            sep1 = ","
-        print("}")
-
-    # Using a fixed buffer reduces heap allocation
+            out, subdirs = [], []  # Print each directory with one call
+            pre = d if d.endswith("/") else d + "/"  # Don't make "//lib" from "/"
+            for f, m, *_ in sorted(os.ilistdir(d)):  # type: ignore
+                p = pre + f
+                if R and m & IS_DIR: subdirs.append(p)
+                out.append(f"{json.dumps(f)}:{self._stat(p) if long else [m]}")
+            print(f"[{json.dumps(d)},{{{','.join(out)}}}]")
+            files.extend(reversed(subdirs))
+
+    # Using a fixed buffer reduces heap allocation (and a memoryview of it
+    # can be sliced without copying). BUF_SIZE is set by the host.
+    BUF_SIZE = 256
     _buf = None
 
     def cp_file(self, f1, f2, v):
         if v: print(f2)
-        if self._buf is None: self._buf = bytearray(1024)
+        if self._buf is None:  # Use a smaller buffer if memory is short
+            size = self.BUF_SIZE
+            if gc.mem_free() < 8 * size: size = min(size, 1024)  # type: ignore
+            self._buf = memoryview(bytearray(size))
         with open(f1, "rb") as f1, open(f2, "wb") as f2:
             while (n := f1.readinto(self._buf)) > 0:
                 f2.write(self._buf[:n])  # type: ignore
 
     def cp_dir(self, d1, d2, v):  # d1 & d2 must end in "/"
-        if v: print(d2)
-        try: os.mkdir(d2[:-1])
-        except OSError: pass
-        for f, m, *_ in os.ilistdir(d1):  # type: ignore
-            if m & IS_DIR: self.cp_dir(d1 + f + "/", d2 + f + "/", v)
-            else: self.cp_file(d1 + f, d2 + f, v)
+        dirs = [(d1, d2)]  # Uses a list instead of recursion for subdirs
+        while dirs:
+            d1, d2 = dirs.pop()
+            if v: print(d2)
+            try: os.mkdir(d2[:-1])
+            except OSError: pass
+            for f, m, *_ in os.ilistdir(d1):  # type: ignore
+                if m & IS_DIR: dirs.append((d1 + f + "/", d2 + f + "/"))
+                else: self.cp_file(d1 + f, d2 + f, v)
 
     def cp(self, files, dirs, dest, v):  # dirs and dest must end in "/"
         for f in files: self.cp_file(f, dest + self.basename(f), v)
         for f in dirs: self.cp_dir(f, dest + self.basename(f), v)
 
-    def rm(self, files, v):
-        for f in files:
+    def rm(self, files, v):  # Uses a list instead of recursion for subdirs
+        files, dirs = files[::-1], []
+        while files:
+            f = files.pop()
             if os.stat(f)[0] & IS_DIR:
-                self.rm((f"{f}/{i[0]}" for i in os.ilistdir(f)), v)  # type: ignore
-                os.rmdir(f)
+                files.extend(f"{f}/{i[0]}" for i in os.ilistdir(f))  # type: ignore
+                dirs.append(f)  # Remove dirs after the files they contain
             else:
                 os.remove(f)
+                if v: print(f)
+        while dirs:  # Subdirs were added after their parents
+            f = dirs.pop()
+            os.rmdir(f)
             if v: print(f)
 
-    def complete(self, base, word):
-        print([w for w in (dir(base) if base else dir()) if w.startswith(word)])
+    def mkdirs(self, dirs):  # Parent dirs must come before their subdirs
+        n = 0  # Stop at the first failure: its subdirs would fail too
+        try:
+            for d in dirs:
+                os.mkdir(d)
+                n += 1
+        except OSError: pass
+        print(n)  # The number of dirs made
 
-    def pr(self):  # Return some dynamic values for the command prompt
-        print([os.getcwd(), gc.mem_alloc(), gc.mem_free()])  # type: ignore
+    def mv(self, moves, v):  # moves is a list of (src, dest) filename pairs
+        for f1, f2 in moves:
+            if v: print(f1, "->", f2)
+            try: os.rename(f1, f2)
+            except OSError as err: print("OSError:", f1, "->", f2, err)  # Carry on
+
+    def df(self, dirs):  # [frsize, blocks, bfree] for each dir
+        print(json.dumps([os.statvfs(d)[1:4] for d in dirs]))  # type: ignore
+
+    def info(self):  # Return the static values for the command prompt
+        import sys
+        st = {"platform": sys.platform}
+        try:
+            from machine import unique_id
+            st["unique_id"] = unique_id().hex(":")
+        except Exception: pass
+        try: st.update(eval(f"dict{os.uname()!r}"))
+        except Exception: pass
+        print(json.dumps(st))
+
+    def status(self, flags):  # Return the requested values in one call
+        st = {}
+        if flags & 1: st["pwd"] = os.getcwd()
+        if flags & 2: st["time"] = list(time.localtime())
+        if flags & 4:
+            before = gc.mem_free()  # type: ignore
+            gc.collect()
+            st["gc"] = [before, gc.mem_free()]  # type: ignore
+        if flags & 8: st["mem"] = [gc.mem_alloc(), gc.mem_free()]  # type: ignore
+        print(json.dumps(st))
 
 
 _helper = _MagicHelper()
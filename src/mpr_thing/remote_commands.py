@@ -63,8 +63,12 @@ class RemoteCmd(BaseCommands):
         "set" command to add or change the file listing colours."""
         opts, args = self._options(args)
         listing = self.board.ls(args, opts)
-        files = [f for f in listing[""] if f.exists() and not f.is_dir()]
-        missing = [f for f in listing[""] if not f.exists()]
+        files, missing = [], []
+        for f in listing.get("", []):  # Empty if the board reported an error
+            if not f.exists():
+                missing.append(f)
+            elif not f.is_dir():
+                files.append(f)
         for f in missing:
             print(f"'{f}': No such file or directory.")
         self.print_files(files, opts)
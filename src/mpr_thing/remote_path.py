@@ -7,30 +7,54 @@ PyBoardExtended interface to a micropython board (from the mpremote tool).
 # For python<3.10: Allow method type annotations to reference enclosing class
 from __future__ import annotations
 
+import os
 import stat
 from pathlib import PurePosixPath
-from typing import Sequence
+from typing import Any, Sequence
 
 
 # Paths on the board are always Posix paths even if local host is Windows.
 class RemotePath(PurePosixPath):
     "A Pathlib compatible class to hold details of files on the board."
 
+    # Slots instead of a __dict__ for each of the (many) paths in a listing
+    __slots__ = ("mode", "size", "mtime", "_exists", "_is_dir", "_is_file")
     epoch_offset: int = 0
 
-    def __init__(self, *_args: str) -> None:
+    def __init__(self, *_args: str | os.PathLike[str]) -> None:
         # Note: Path initialises from *args in __new__()!!!
+        self._clear_stat()
+
+    # PurePath builds derived paths (/, parent, parents, joinpath, with_name,
+    # ...) through these classmethods without calling __init__(), which would
+    # leave the slots unset.
+    @classmethod
+    def _from_parts(cls, *args: Any, **kwargs: Any) -> RemotePath:
+        return super()._from_parts(*args, **kwargs)._clear_stat()  # type: ignore
+
+    @classmethod
+    def _from_parsed_parts(cls, *args: Any, **kwargs: Any) -> RemotePath:
+        return (
+            super()._from_parsed_parts(*args, **kwargs)  # type: ignore
+            ._clear_stat()
+        )
+
+    def _clear_stat(self) -> RemotePath:
         self.mode = 0
         self.size = 0
         self.mtime = 0
-        self._exists = False
+        self._exists = self._is_dir = self._is_file = False
+        return self
 
     def set_stat(self, modes: Sequence[int]) -> RemotePath:
         """Set the file mode, size and mtime values."""
         self.mode = modes[0] if modes else 0
         self.size = modes[1] if modes[1:] else -1
         self.mtime = modes[2] + self.epoch_offset if modes[2:] else -1
+        # Work out the file type once, rather than on every is_dir() call.
         self._exists = bool(modes)
+        self._is_dir = self._exists and (self.mode & stat.S_IFDIR) != 0
+        self._is_file = self._exists and (self.mode & stat.S_IFREG) != 0
         return self  # So we can f = RemotePath('/main.py').set_modes(...)
 
     def modes(self) -> tuple[int, int, int]:
@@ -41,23 +65,15 @@ class RemotePath(PurePosixPath):
 
     def is_dir(self) -> bool:
         "Return True if the file is a directory."
-        return (
-            hasattr(self, "_exists")
-            and self._exists
-            and ((self.mode & stat.S_IFDIR) != 0)
-        )
+        return self._is_dir
 
     def is_file(self) -> bool:
         "Return True if the file is a regular file."
-        return (
-            hasattr(self, "_exists")
-            and self._exists
-            and ((self.mode & stat.S_IFREG) != 0)
-        )
+        return self._is_file
 
     def exists(self) -> bool:
         "Return True if the file exists."
-        return hasattr(self, "_exists") and self._exists
+        return self._exists
 
     def __repr__(self) -> str:
         return f"RemotePath({self.name!r}, {[self.mode, self.size, self.mtime]})"